@@ -1,11 +1,30 @@
+import json
 import re
 import time
 import requests
 import os
 import logging
+import queue
+import threading
 import stat
+import string
+from dataclasses import dataclass, field
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Callable, Dict, Iterable, Iterator, List, Match, Optional, Pattern, Tuple
+
+try:
+    from inotify_simple import INotify, flags
+except ImportError:  # Non-Linux platforms fall back to polling
+    INotify = None
+
+try:
+    from orjson import dumps as json_dumps
+except ImportError:  # Fall back to the stdlib encoder
+    def json_dumps(obj: object) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
 
 # Configure logging
 logging.basicConfig(
@@ -14,81 +33,184 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Environment variables
-LOG_FILE = os.getenv('LOG_FILE', '/logs/latest.log')
-NOTIFY_SERVICE = os.getenv('NOTIFY_SERVICE', 'ntfy').lower()  # 'ntfy' or 'discord'
-LOG_FORMAT = os.getenv('LOG_FORMAT', 'server').lower()  # 'server' or 'velocity'
-NTFY_TOPIC = os.getenv('NTFY_TOPIC')
-NTFY_URL = os.getenv('NTFY_URL', 'https://ntfy.sh')
-NTFY_TOKEN = os.getenv('NTFY_TOKEN')
-DISCORD_WEBHOOK_URL = os.getenv('DISCORD_WEBHOOK_URL')
-NOTIFY_SUBJECT = os.getenv('NOTIFY_SUBJECT', 'Minecraft Server')  # Title for notifications
-NOTIFY_JOIN = os.getenv('NOTIFY_JOIN', 'true').lower() == 'true'
-NOTIFY_LEAVE = os.getenv('NOTIFY_LEAVE', 'true').lower() == 'true'
-NOTIFY_WHITELIST = os.getenv('NOTIFY_WHITELIST', 'true').lower() == 'true'
-
-# Regex patterns for events
+@dataclass(frozen=True)
+class Config:
+    """Settings read from the environment."""
+    log_file: str
+    notify_service: str  # 'ntfy' or 'discord'
+    log_format: str  # 'server' or 'velocity'
+    ntfy_topic: Optional[str]
+    ntfy_url: str
+    ntfy_token: Optional[str]
+    discord_webhook_url: Optional[str]
+    notify_subject: str  # Title for notifications
+    notify_join: bool
+    notify_leave: bool
+    notify_whitelist: bool
+    notify_coalesce_ms: Optional[int]  # Window for merging bursts of events, 0 disables, None if invalid
+    ntfy_headers: Dict[str, str] = field(compare=False)  # Headers shared by every ntfy request
+
+def parse_coalesce_ms(value: str) -> Optional[int]:
+    """Parse NOTIFY_COALESCE_MS, returning None unless it is a non-negative integer."""
+    try:
+        window_ms = int(value)
+    except ValueError:
+        return None
+    return window_ms if window_ms >= 0 else None
+
+def build_ntfy_headers(ntfy_token: Optional[str]) -> Dict[str, str]:
+    """Build the headers shared by every ntfy request."""
+    headers = {"Content-Type": "text/plain; charset=utf-8"}
+    if ntfy_token:
+        headers["Authorization"] = f"Bearer {ntfy_token}"
+    return headers
+
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Read the environment once and return the resulting settings."""
+    ntfy_token = os.getenv('NTFY_TOKEN')
+    return Config(
+        log_file=os.getenv('LOG_FILE', '/logs/latest.log'),
+        notify_service=os.getenv('NOTIFY_SERVICE', 'ntfy').lower(),
+        log_format=os.getenv('LOG_FORMAT', 'server').lower(),
+        ntfy_topic=os.getenv('NTFY_TOPIC'),
+        ntfy_url=os.getenv('NTFY_URL', 'https://ntfy.sh'),
+        ntfy_token=ntfy_token,
+        discord_webhook_url=os.getenv('DISCORD_WEBHOOK_URL'),
+        notify_subject=os.getenv('NOTIFY_SUBJECT', 'Minecraft Server'),
+        notify_join=os.getenv('NOTIFY_JOIN', 'true').lower() == 'true',
+        notify_leave=os.getenv('NOTIFY_LEAVE', 'true').lower() == 'true',
+        notify_whitelist=os.getenv('NOTIFY_WHITELIST', 'true').lower() == 'true',
+        notify_coalesce_ms=parse_coalesce_ms(os.getenv('NOTIFY_COALESCE_MS', '0')),
+        ntfy_headers=build_ntfy_headers(ntfy_token),
+    )
+
+# Accepted configuration values
+LOG_FORMATS = ('server', 'velocity')
+URL_SCHEMES = ('http://', 'https://')
+DISCORD_WEBHOOK_PREFIX = 'https://discord.com/api/webhooks/'
+
+READ_SIZE = 65536  # Bytes requested from the log per read() call
+CHECK_INTERVAL = 5  # Seconds between rotation checks while the log is changing
+MAX_CHECK_INTERVAL = 60  # Upper bound for the rotation check interval while the log is idle
+# Polling fallback naps between reads at EOF. select() cannot replace this
+# because regular files always poll as readable, so the nap grows while idle.
+EOF_SLEEP = 0.1
+MAX_EOF_SLEEP = 1.0
+
+# Shared HTTP session so notifications reuse a warm keep-alive connection
+# instead of paying for DNS, TCP and TLS setup on every send
+HTTP_ADAPTER = HTTPAdapter(
+    pool_connections=2,
+    pool_maxsize=4,
+    max_retries=Retry(
+        total=2,
+        read=0,  # A POST that timed out may already have been delivered; don't resend it
+        backoff_factor=0.2,
+        status_forcelist=[502, 503, 504],
+        allowed_methods=frozenset(['POST'])
+    )
+)
+HTTP_SESSION = requests.Session()
+HTTP_SESSION.mount('https://', HTTP_ADAPTER)
+HTTP_SESSION.mount('http://', HTTP_ADAPTER)  # Self-hosted ntfy servers may be plain http
+
+# Pending (message, title, player) notifications, drained by notification_worker
+# so the log loop never waits on HTTP
+NOTIFICATION_QUEUE: "queue.Queue[Tuple[str, str, Optional[str]]]" = queue.Queue(maxsize=256)
+
+# Regex patterns for events. Capture groups are prefixed with the event name.
 # Standard Minecraft patterns
-SERVER_JOIN_PATTERN = re.compile(r"\[Server thread/INFO\]: (\w+) joined the game")
-SERVER_LEAVE_PATTERN = re.compile(r"\[Server thread/INFO\]: (\w+) left the game")
-SERVER_WHITELIST_PATTERN = re.compile(r"\[Server thread/INFO\]: (\w+) was kicked due to: You are not white-listed on this server!")
+SERVER_EVENT_PATTERNS = {
+    'join': r"\[Server thread/INFO\]: (?P<join_player>\w+) joined the game",
+    'leave': r"\[Server thread/INFO\]: (?P<leave_player>\w+) left the game",
+    'whitelist': r"\[Server thread/INFO\]: (?P<whitelist_player>\w+) was kicked due to: You are not white-listed on this server!",
+}
 # Velocity patterns
-VELOCITY_JOIN_PATTERN = re.compile(r"\[server connection\] (\.?\w+) -> (\w+) has connected")
-VELOCITY_LEAVE_PATTERN = re.compile(r"\[server connection\] (\.?\w+) -> (\w+) has disconnected")
-VELOCITY_WHITELIST_PATTERN = re.compile(
-    r"\[connected player\] (\.?\w+) \(/[\d.:]+\): disconnected while connecting to (\w+): You are not whitelisted on this server!"
-)
+VELOCITY_EVENT_PATTERNS = {
+    'join': r"\[server connection\] (?P<join_player>\.?\w+) -> (?P<join_server>\w+) has connected",
+    'leave': r"\[server connection\] (?P<leave_player>\.?\w+) -> (?P<leave_server>\w+) has disconnected",
+    'whitelist': (
+        r"\[connected player\] (?P<whitelist_player>\.?\w+) \(/[\d.:]+\): disconnected while connecting to "
+        r"(?P<whitelist_server>\w+): You are not whitelisted on this server!"
+    ),
+}
+
+# Literal phrases that must appear in a line for its event pattern to match.
+# A substring hit both rejects the vast majority of log lines without touching
+# the regex engine and picks the single event pattern worth running.
+SERVER_EVENT_KEYWORDS = {
+    'join': "joined the game",
+    'leave': "left the game",
+    'whitelist': "white-listed",
+}
+VELOCITY_EVENT_KEYWORDS = {
+    'join': "has connected",
+    'leave': "has disconnected",
+    'whitelist': "not whitelisted",
+}
+
+# Callback that notifies for one event's match
+EventHandler = Callable[[Match[bytes]], None]
+# (keyword, pattern, handler) triples checked in order against each log line
+EventMatcher = Tuple[bytes, Pattern[bytes], EventHandler]
+
+# Events whose notifications may be merged into one when they arrive in a burst
+COALESCED_EVENTS = ('join', 'leave')
+
+# Notification messages for each event, formatted with the event's capture groups
+SERVER_EVENT_MESSAGES = {
+    'join': "{player} joined the server",
+    'leave': "{player} left the server",
+    'whitelist': "{player} failed to join (not whitelisted)",
+}
+VELOCITY_EVENT_MESSAGES = {
+    'join': "{player} joined {server}",
+    'leave': "{player} left {server}",
+    'whitelist': "{player} failed to join {server} (not whitelisted)",
+}
 
 def validate_config() -> bool:
     """Validate required environment variables based on notification service and log format."""
-    if not LOG_FILE:
-        logger.error("Missing required environment variable: LOG_FILE")
-        return False
-    
-    if not Path(LOG_FILE).parent.exists():
-        logger.error(f"Log file directory does not exist: {Path(LOG_FILE).parent}")
-        return False
-
-    if not NOTIFY_SUBJECT:
-        logger.error("NOTIFY_SUBJECT cannot be empty")
-        return False
-
-    if LOG_FORMAT not in ('server', 'velocity'):
-        logger.error("Invalid LOG_FORMAT. Must be 'server' or 'velocity'")
-        return False
-
-    if NOTIFY_SERVICE == 'ntfy':
-        if not NTFY_TOPIC:
-            logger.error("Missing required environment variable: NTFY_TOPIC")
-            return False
-        if not NTFY_URL.startswith(('http://', 'https://')):
-            logger.error("NTFY_URL must start with http:// or https://")
-            return False
-    elif NOTIFY_SERVICE == 'discord':
-        if not DISCORD_WEBHOOK_URL:
-            logger.error("Missing required environment variable: DISCORD_WEBHOOK_URL")
-            return False
-        if not DISCORD_WEBHOOK_URL.startswith('https://discord.com/api/webhooks/'):
-            logger.error("DISCORD_WEBHOOK_URL appears invalid")
-            return False
+    config = get_config()
+    log_dir = Path(config.log_file).parent
+
+    # (check, error) pairs evaluated in order; checks are lazy so later ones can
+    # rely on earlier ones having passed
+    rules: List[Tuple[Callable[[], bool], str]] = [
+        (lambda: bool(config.log_file), "Missing required environment variable: LOG_FILE"),
+        (log_dir.exists, f"Log file directory does not exist: {log_dir}"),
+        (lambda: bool(config.notify_subject), "NOTIFY_SUBJECT cannot be empty"),
+        (lambda: config.notify_coalesce_ms is not None, "NOTIFY_COALESCE_MS must be a non-negative integer"),
+        (lambda: config.log_format in LOG_FORMATS, "Invalid LOG_FORMAT. Must be 'server' or 'velocity'"),
+    ]
+    if config.notify_service == 'ntfy':
+        rules += [
+            (lambda: bool(config.ntfy_topic), "Missing required environment variable: NTFY_TOPIC"),
+            (lambda: config.ntfy_url.startswith(URL_SCHEMES), "NTFY_URL must start with http:// or https://"),
+        ]
+    elif config.notify_service == 'discord':
+        rules += [
+            (lambda: bool(config.discord_webhook_url), "Missing required environment variable: DISCORD_WEBHOOK_URL"),
+            (lambda: config.discord_webhook_url.startswith(DISCORD_WEBHOOK_PREFIX), "DISCORD_WEBHOOK_URL appears invalid"),
+        ]
     else:
-        logger.error("Invalid NOTIFY_SERVICE. Must be 'ntfy' or 'discord'")
-        return False
+        rules.append((lambda: False, "Invalid NOTIFY_SERVICE. Must be 'ntfy' or 'discord'"))
 
+    for check, error in rules:
+        if not check():
+            logger.error(error)
+            return False
     return True
 
-def send_ntfy_notification(message: str, title: str = NOTIFY_SUBJECT) -> None:
+def send_ntfy_notification(message: str, title: Optional[str] = None) -> None:
     """Send a notification to ntfy."""
-    headers = {
-        "Title": title,
-        "Content-Type": "text/plain; charset=utf-8"
-    }
-    if NTFY_TOKEN:
-        headers["Authorization"] = f"Bearer {NTFY_TOKEN}"
+    config = get_config()
+    headers = {**config.ntfy_headers, "Title": title or config.notify_subject}
 
     try:
-        response = requests.post(
-            f"{NTFY_URL}/{NTFY_TOPIC}",
+        response = HTTP_SESSION.post(
+            f"{config.ntfy_url}/{config.ntfy_topic}",
             data=message.encode("utf-8"),
             headers=headers,
             timeout=10
@@ -98,19 +220,21 @@ def send_ntfy_notification(message: str, title: str = NOTIFY_SUBJECT) -> None:
     except requests.RequestException as e:
         logger.error(f"Failed to send ntfy notification: {e}")
 
-def send_discord_notification(message: str, title: str = NOTIFY_SUBJECT) -> None:
+def send_discord_notification(message: str, title: Optional[str] = None) -> None:
     """Send a notification to Discord via webhook."""
+    config = get_config()
     payload = {
         "embeds": [{
-            "title": title,
+            "title": title or config.notify_subject,
             "description": message,
             "color": 0x00ff00  # Green color
         }]
     }
     try:
-        response = requests.post(
-            DISCORD_WEBHOOK_URL,
-            json=payload,
+        response = HTTP_SESSION.post(
+            config.discord_webhook_url,
+            data=json_dumps(payload),
+            headers={"Content-Type": "application/json"},
             timeout=10
         )
         response.raise_for_status()
@@ -118,13 +242,64 @@ def send_discord_notification(message: str, title: str = NOTIFY_SUBJECT) -> None
     except requests.RequestException as e:
         logger.error(f"Failed to send Discord notification: {e}")
 
-def send_notification(message: str, title: str = NOTIFY_SUBJECT) -> None:
+def dispatch_notification(message: str, title: Optional[str] = None) -> None:
     """Route notification to the appropriate service."""
-    if NOTIFY_SERVICE == 'ntfy':
+    notify_service = get_config().notify_service
+    if notify_service == 'ntfy':
         send_ntfy_notification(message, title)
-    elif NOTIFY_SERVICE == 'discord':
+    elif notify_service == 'discord':
         send_discord_notification(message, title)
 
+def send_notification(message: str, title: Optional[str] = None, player: Optional[str] = None) -> None:
+    """Queue a notification for the background worker, dropping it if the queue is full.
+
+    Messages that start with player can be merged with other players' identical
+    events when NOTIFY_COALESCE_MS is set.
+    """
+    title = title or get_config().notify_subject
+    try:
+        NOTIFICATION_QUEUE.put_nowait((message, title, player))
+    except queue.Full:
+        logger.warning(f"Notification queue full, dropping: {message}")
+
+def coalesce_notifications(batch: List[Tuple[str, str, Optional[str]]]) -> List[Tuple[str, str]]:
+    """Merge consecutive queued notifications that differ only by player, preserving order.
+
+    Only adjacent runs are merged so a later event for the same player (e.g. a
+    leave after a join) is never reported before an earlier one.
+    """
+    runs: List[Tuple[str, str, List[str]]] = []  # (title, message after the player, players)
+    for message, title, player in batch:
+        if player and message.startswith(player):
+            rest = message[len(player):]
+            if runs and runs[-1][2] and runs[-1][:2] == (title, rest):
+                if player not in runs[-1][2]:
+                    runs[-1][2].append(player)
+                continue
+            runs.append((title, rest, [player]))
+        else:
+            runs.append((title, message, []))
+    return [(", ".join(players) + rest, title) for title, rest, players in runs]
+
+def notification_worker() -> None:
+    """Send queued notifications forever, merging those that arrive within the coalesce window."""
+    window = get_config().notify_coalesce_ms / 1000
+    while True:
+        batch = [NOTIFICATION_QUEUE.get()]
+        if window:
+            deadline = time.monotonic() + window
+            while (remaining := deadline - time.monotonic()) > 0:
+                try:
+                    batch.append(NOTIFICATION_QUEUE.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+        for message, title in coalesce_notifications(batch):
+            try:
+                dispatch_notification(message, title)
+            except Exception as e:
+                logger.error(f"Unexpected error sending notification: {e}")
+
 def get_file_info(file_path: str) -> Optional[dict]:
     """Get inode and modification time of a file, or None if it doesn't exist."""
     try:
@@ -136,71 +311,239 @@ def get_file_info(file_path: str) -> Optional[dict]:
     except (FileNotFoundError, PermissionError):
         return None
 
-def get_latest_log_file(log_dir: Path) -> Optional[Path]:
-    """Find the most recently modified log file in the directory."""
+def enabled_events() -> Tuple[str, ...]:
+    """Return the names of the events whose notifications are turned on."""
+    config = get_config()
+    toggles = (('join', config.notify_join), ('leave', config.notify_leave), ('whitelist', config.notify_whitelist))
+    return tuple(event for event, enabled in toggles if enabled)
+
+def notify_event(
+    message: str,
+    groups: Tuple[Tuple[str, str], ...],
+    coalesce: bool,
+    match: Match[bytes]
+) -> None:
+    """Fill message with the names captured by match and queue the notification."""
+    # Only the captured names are decoded; the rest of the line stays as bytes
+    fields = {field: match.group(group).decode('utf-8', 'replace') for field, group in groups}
+    send_notification(message.format(**fields), player=fields['player'] if coalesce else None)
+
+def make_event_handler(event: str, message: str) -> EventHandler:
+    """Bind an event's message to the capture groups it references, once per process."""
+    groups = tuple(
+        (field, f"{event}_{field}")
+        for _, field, _, _ in string.Formatter().parse(message)
+        if field
+    )
+    return partial(notify_event, message, groups, event in COALESCED_EVENTS)
+
+def compile_event_matchers(
+    event_patterns: Dict[str, str],
+    event_keywords: Dict[str, str],
+    event_messages: Dict[str, str],
+    events: Tuple[str, ...]
+) -> Tuple[EventMatcher, ...]:
+    """Bundle each of the given events' keyword, compiled pattern and notification handler."""
+    return tuple(
+        (
+            event_keywords[event].encode(),
+            re.compile(event_patterns[event].encode()),
+            make_event_handler(event, event_messages[event])
+        )
+        for event in events
+    )
+
+def process_lines(
+    lines: Iterable[bytes],
+    matchers: Tuple[EventMatcher, ...]
+) -> int:
+    """Match log lines against the event matchers and notify on hits.
+
+    Returns the number of lines consumed.
+    """
+    count = 0
+    for line in lines:
+        count += 1
+        # Cheap substring scan first; only the pattern of the event a line
+        # mentions is run, and lines mentioning none never reach the regex
+        for keyword, pattern, handler in matchers:
+            if keyword in line and (match := pattern.search(line)):
+                handler(match)
+                break
+    return count
+
+def open_log(file_path: str, from_start: bool = False) -> Optional[int]:
+    """Open the log file as a raw descriptor, positioned at its end unless from_start is set."""
     try:
-        log_files = [f for f in log_dir.iterdir() if f.is_file() and f.name.startswith('latest.log')]
-        if not log_files:
-            return None
-        return max(log_files, key=lambda f: os.stat(f).st_mtime)
-    except (OSError, PermissionError) as e:
-        logger.error(f"Error scanning log directory {log_dir}: {e}")
+        fd = os.open(file_path, os.O_RDONLY)
+    except FileNotFoundError:
         return None
+    if not from_start:
+        os.lseek(fd, 0, os.SEEK_END)
+    return fd
 
-def follow_log(file_path: str) -> None:
-    """Follow the log file, handling rotations by scanning the log directory."""
-    file = Path(file_path)
-    log_dir = file.parent
+def read_lines(fd: int, buffer: bytearray) -> Iterator[bytes]:
+    """Read everything currently available from fd, yielding complete lines.
+
+    A trailing partial line is kept in buffer until the rest of it is written.
+    """
+    while True:
+        chunk = os.read(fd, READ_SIZE)
+        if not chunk:
+            return
+        if b'\n' not in chunk:
+            # Still inside one long line; append in place rather than copying
+            # the pending bytes again on every read
+            buffer += chunk
+            continue
+        # Split the whole chunk in one C-level pass; the last piece is either
+        # empty or a line still being written
+        data = bytes(buffer) + chunk if buffer else chunk
+        *lines, tail = data.split(b'\n')
+        buffer[:] = tail
+        yield from lines
+
+def log_replaced(file_path: str, fd: int) -> bool:
+    """Return True if file_path no longer refers to the file open on fd."""
+    try:
+        return os.stat(file_path).st_ino != os.fstat(fd).st_ino
+    except FileNotFoundError:
+        return True
+
+def watch_log(
+    file_path: str,
+    inotify: "INotify",
+    matchers: Tuple[EventMatcher, ...]
+) -> None:
+    """Follow the log file using inotify, reopening it when the directory reports a rotation."""
+    log_dir = os.path.dirname(file_path) or '.'
+    file_name = os.path.basename(file_path)
+    fd = None
+    buffer = bytearray()
+    file_watch = None
+    reopen_from_start = False
+
+    inotify.add_watch(log_dir, flags.CREATE | flags.MOVED_TO | flags.DELETE | flags.MOVED_FROM)
+    logger.info(f"Starting to monitor {file_path} in directory {log_dir} with log format: {get_config().log_format} (inotify)")
+
+    while True:
+        try:
+            if fd is None:
+                fd = open_log(file_path, from_start=reopen_from_start)
+                if fd is not None:
+                    reopen_from_start = False
+                    buffer.clear()
+                    file_watch = inotify.add_watch(file_path, flags.MODIFY)
+                    logger.info(f"Monitoring log file {file_path} (inode: {os.fstat(fd).st_ino})")
+
+            # Drain everything written since the last wakeup
+            if fd is not None:
+                process_lines(read_lines(fd, buffer), matchers)
+
+            # Block until the kernel reports a write or a directory change
+            rotated = False
+            events = inotify.read(timeout=CHECK_INTERVAL * 1000)
+            for event in events:
+                if event.name != file_name:
+                    continue
+                if event.mask & (flags.DELETE | flags.MOVED_FROM) or fd is None:
+                    rotated = True
+                elif log_replaced(file_path, fd):
+                    # A CREATE/MOVED_TO can still be queued for the file we already
+                    # reopened after its MOVED_FROM; only a different inode is new
+                    rotated = True
+
+            # Some mounts (NFS/SMB, Docker Desktop host mounts) never deliver
+            # directory events, so check the inode whenever the wait times out
+            if not events and fd is not None and log_replaced(file_path, fd):
+                rotated = True
+
+            if rotated:
+                if fd is not None:
+                    # Pick up anything written to the old file before it was replaced
+                    process_lines(read_lines(fd, buffer), matchers)
+                    os.close(fd)
+                    fd = None
+                    logger.info(f"Log file {file_path} rotated, reopening")
+                if file_watch is not None:
+                    try:
+                        inotify.rm_watch(file_watch)
+                    except OSError:
+                        pass  # Watch already dropped by the kernel when the file was deleted
+                    file_watch = None
+                reopen_from_start = True
+
+        except (IOError, PermissionError) as e:
+            logger.error(f"Error reading log file: {e}")
+            if fd is not None:
+                os.close(fd)
+                fd = None
+            time.sleep(1)  # Wait before retrying
+        except Exception as e:
+            logger.error(f"Unexpected error in watch_log: {e}")
+            time.sleep(1)
+
+def poll_log(
+    file_path: str,
+    matchers: Tuple[EventMatcher, ...]
+) -> None:
+    """Follow the log file, handling rotations by checking its inode and mtime."""
+    log_dir = os.path.dirname(file_path) or '.'
     current_inode = None
     current_mtime = None
-    file_handle = None
+    fd = None
+    buffer = bytearray()
     last_check = 0
-    check_interval = 5  # Check for file changes every 5 seconds
+    check_interval = CHECK_INTERVAL
+    idle_streak = 0  # Consecutive checks that found the file unchanged
+    eof_sleep = EOF_SLEEP
 
-    # Select patterns based on LOG_FORMAT
-    join_pattern = VELOCITY_JOIN_PATTERN if LOG_FORMAT == 'velocity' else SERVER_JOIN_PATTERN
-    leave_pattern = VELOCITY_LEAVE_PATTERN if LOG_FORMAT == 'velocity' else SERVER_LEAVE_PATTERN
-    whitelist_pattern = VELOCITY_WHITELIST_PATTERN if LOG_FORMAT == 'velocity' else SERVER_WHITELIST_PATTERN
-
-    logger.info(f"Starting to monitor {file_path} in directory {log_dir} with log format: {LOG_FORMAT}")
+    logger.info(f"Starting to monitor {file_path} in directory {log_dir} with log format: {get_config().log_format} (polling)")
 
     while True:
         try:
             # Periodically check for log file changes
             current_time = time.time()
             if current_time - last_check >= check_interval:
-                # Find the latest log file
-                latest_log = get_latest_log_file(log_dir)
-                file_exists = file.exists()
+                # The stat doubles as the existence check
+                file_info = get_file_info(file_path)
 
                 # If no log file exists, wait and retry
-                if not file_exists or not latest_log:
-                    if file_handle:
-                        file_handle.close()
-                        file_handle = None
+                if not file_info:
+                    if fd is not None:
+                        os.close(fd)
+                        fd = None
                         logger.warning(f"Log file {file_path} not found, waiting for it to appear")
+                    idle_streak = 0
+                    check_interval = CHECK_INTERVAL
                     time.sleep(1)
                     continue
 
-                # Get current file info
-                file_info = get_file_info(file_path)
-                if file_info:
-                    new_inode = file_info["inode"]
-                    new_mtime = file_info["mtime"]
+                new_inode = file_info["inode"]
+                new_mtime = file_info["mtime"]
+
+                # Back off while nothing changes; any change returns to the base interval
+                if new_inode == current_inode and new_mtime == current_mtime:
+                    idle_streak += 1
+                    check_interval = min(MAX_CHECK_INTERVAL, CHECK_INTERVAL * 2 ** min(idle_streak, 4))
+                else:
+                    idle_streak = 0
+                    check_interval = CHECK_INTERVAL
+
+                if fd is not None and new_inode == current_inode:
+                    # Same file, only written to; keep reading from the current offset
+                    current_mtime = new_mtime
                 else:
-                    new_inode = None
-                    new_mtime = None
-
-                # Check if the file has changed (inode or mtime indicates rotation)
-                if (new_inode != current_inode or new_mtime != current_mtime or file_handle is None) and file_info:
-                    if file_handle:
-                        file_handle.close()
-                        logger.info(
-                            f"Log file changed (inode: {current_inode} -> {new_inode}, "
-                            f"mtime: {current_mtime} -> {new_mtime}), reopening {file_path}"
-                        )
-                    file_handle = open(file, "r", encoding='utf-8')
-                    file_handle.seek(0, 2)  # Seek to end
+                    if fd is not None:
+                        # Pick up anything written to the old file before it was replaced
+                        process_lines(read_lines(fd, buffer), matchers)
+                        os.close(fd)
+                        logger.info(f"Log file changed (inode: {current_inode} -> {new_inode}), reopening {file_path}")
+                    # A new inode is a fresh file, so read it from the start rather than
+                    # dropping whatever was written before a backed-off check noticed it
+                    rotated = current_inode is not None and new_inode != current_inode
+                    fd = open_log(file_path, from_start=rotated)
+                    buffer.clear()
                     current_inode = new_inode
                     current_mtime = new_mtime
                     logger.info(f"Monitoring log file {file_path} (inode: {current_inode}, mtime: {current_mtime})")
@@ -208,74 +551,80 @@ def follow_log(file_path: str) -> None:
                 last_check = current_time
 
             # Read new lines
-            if file_handle:
-                line = file_handle.readline()
-                if not line:
-                    time.sleep(0.1)  # Avoid CPU overuse
-                    continue
-
-                # Check for join event
-                if NOTIFY_JOIN:
-                    join_match = join_pattern.search(line)
-                    if join_match:
-                        player = join_match.group(1)
-                        if LOG_FORMAT == 'velocity':
-                            server = join_match.group(2)
-                            message = f"{player} joined {server}"
-                        else:
-                            message = f"{player} joined the server"
-                        send_notification(message)
-                        continue
-                
-                # Check for leave event
-                if NOTIFY_LEAVE:
-                    leave_match = leave_pattern.search(line)
-                    if leave_match:
-                        player = leave_match.group(1)
-                        if LOG_FORMAT == 'velocity':
-                            server = leave_match.group(2)
-                            message = f"{player} left {server}"
-                        else:
-                            message = f"{player} left the server"
-                        send_notification(message)
-                        continue
-                
-                # Check for whitelist failure
-                if NOTIFY_WHITELIST:
-                    whitelist_match = whitelist_pattern.search(line)
-                    if whitelist_match:
-                        player = whitelist_match.group(1)
-                        if LOG_FORMAT == 'velocity':
-                            server = whitelist_match.group(2)
-                            message = f"{player} failed to join {server} (not whitelisted)"
-                        else:
-                            message = f"{player} failed to join (not whitelisted)"
-                        send_notification(message)
-                        continue
+            if fd is not None:
+                if process_lines(read_lines(fd, buffer), matchers):
+                    eof_sleep = EOF_SLEEP
+                else:
+                    time.sleep(eof_sleep)  # Avoid CPU overuse
+                    eof_sleep = min(MAX_EOF_SLEEP, eof_sleep * 2)
 
         except (IOError, PermissionError) as e:
             logger.error(f"Error reading log file: {e}")
-            if file_handle:
-                file_handle.close()
-                file_handle = None
+            if fd is not None:
+                os.close(fd)
+                fd = None
             time.sleep(1)  # Wait before retrying
         except Exception as e:
-            logger.error(f"Unexpected error in follow_log: {e}")
+            logger.error(f"Unexpected error in poll_log: {e}")
             time.sleep(1)
 
+def follow_log(file_path: str) -> None:
+    """Follow the log file, using inotify when available and falling back to polling."""
+    # Select patterns based on LOG_FORMAT
+    events = enabled_events()
+    if get_config().log_format == 'velocity':
+        matchers = compile_event_matchers(
+            VELOCITY_EVENT_PATTERNS, VELOCITY_EVENT_KEYWORDS, VELOCITY_EVENT_MESSAGES, events
+        )
+    else:
+        matchers = compile_event_matchers(
+            SERVER_EVENT_PATTERNS, SERVER_EVENT_KEYWORDS, SERVER_EVENT_MESSAGES, events
+        )
+
+    inotify = None
+    if INotify is not None:
+        try:
+            inotify = INotify()
+        except OSError as e:
+            logger.warning(f"inotify unavailable ({e}), falling back to polling")
+    else:
+        logger.warning("inotify_simple not installed, falling back to polling")
+
+    if inotify is None:
+        poll_log(file_path, matchers)
+        return
+    try:
+        watch_log(file_path, inotify, matchers)
+    finally:
+        inotify.close()
+
 def main() -> None:
     """Main function to start monitoring."""
     if not validate_config():
         logger.error("Configuration validation failed. Exiting...")
         exit(1)
-    
+
+    # Nothing would ever be sent, so don't tail and scan the log at all. Idle
+    # rather than exit, since the container runs with restart: always.
+    if not enabled_events():
+        logger.warning("All event notifications are disabled, nothing to monitor")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            logger.info("Shutting down monitor")
+        return
+
+    config = get_config()
+    threading.Thread(target=notification_worker, name="notification-worker", daemon=True).start()
+
     logger.info(
         f"Starting Minecraft server monitor "
-        f"(Service: {NOTIFY_SERVICE}, Log Format: {LOG_FORMAT}, Subject: {NOTIFY_SUBJECT}, "
-        f"Join: {NOTIFY_JOIN}, Leave: {NOTIFY_LEAVE}, Whitelist: {NOTIFY_WHITELIST})"
+        f"(Service: {config.notify_service}, Log Format: {config.log_format}, Subject: {config.notify_subject}, "
+        f"Join: {config.notify_join}, Leave: {config.notify_leave}, Whitelist: {config.notify_whitelist}, "
+        f"Coalesce: {config.notify_coalesce_ms}ms)"
     )
     try:
-        follow_log(LOG_FILE)
+        follow_log(config.log_file)
     except KeyboardInterrupt:
         logger.info("Shutting down monitor")
     except Exception as e: